@@ -1,66 +1,194 @@
-from functools import partial
-from typing import Iterable, Dict, Callable, cast
+import argparse
+import json
+from collections import deque
+from typing import Iterable, Dict, Callable, Optional, Iterator, Tuple, Any, List
 
-from more_itertools.recipes import consume
+try:
+    import ijson
+except ModuleNotFoundError:
+    ijson = None
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+from .utils import orjson_loads, MISSING
+
+_IO_BUFFER_SIZE = 1 << 16
+_LEAF_TYPES = frozenset((str, int, float, bool, type(None)))
+_CONTAINER_STARTS = {"start_map": "{", "start_array": "["}
+_CONTAINER_ENDS = {"end_map": "}", "end_array": "]"}
 
 
 def remove_type_data(data, type_key: str) -> None:
-    callback = cast(
-        Callable[[dict], None], partial(_delete_type_key, type_key=type_key)
-    )
-    _iterate_data(data, callback)
+    _iterate_data(data, _type_key_remover(type_key))
 
 
 def rename_types(data, type_key: str, rename_map: Dict[str, str]) -> None:
-    callback = cast(
-        Callable[[dict], None],
-        partial(_rename_types, type_key=type_key, rename_map=rename_map),
-    )
-    _iterate_data(data, callback)
+    _iterate_data(data, _type_renamer(type_key, rename_map))
 
 
 def _iterate_data(data, callback: Callable[[dict], None]) -> None:
-    if isinstance(data, dict):
-        callback(data)
-        consume(_iterate_data(v, callback) for v in data.values())
-    elif isinstance(data, Iterable) and not isinstance(data, str):
-        consume(_iterate_data(i, callback) for i in data)
-
-
-def _delete_type_key(data: dict, type_key: str) -> None:
-    data.pop(type_key, None)
-
-
-def _rename_types(data: dict, type_key: str, rename_map: Dict[str, str]) -> None:
-    if type_key not in data:
-        return
-    renamed = rename_map.get(data[type_key])
-    if renamed is not None:
-        data[type_key] = renamed
+    stack = deque([data])
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is dict:
+            callback(node)
+            stack.extend(node.values())
+        elif node_type is list:
+            stack.extend(node)
+        elif node_type in _LEAF_TYPES:
+            continue
+        elif isinstance(node, dict):
+            callback(node)
+            stack.extend(node.values())
+        elif isinstance(node, Iterable) and not isinstance(node, (str, bytes)):
+            stack.extend(node)
+
+
+def _type_key_remover(type_key: str) -> Callable[[dict], dict]:
+    def remove_type_key(d: dict) -> dict:
+        d.pop(type_key, None)
+        return d
+
+    return remove_type_key
+
+
+def _type_renamer(type_key: str, rename_map: Dict[str, str]) -> Callable[[dict], dict]:
+    def rename_type(d: dict) -> dict:
+        renamed = rename_map.get(d.get(type_key))
+        if renamed is not None:
+            d[type_key] = renamed
+        return d
+
+    return rename_type
+
+
+def _fix_json_events(
+    events: Iterable[Tuple[str, str, Any]],
+    type_key: str,
+    rename_map: Optional[Dict[str, str]] = None,
+) -> Iterator[str]:
+    """
+    Re-encodes ``ijson.parse`` events as json, while removing the type key from every object
+    (or renaming the types according to ``rename_map`` if it's given).
+    Only the currently open containers are kept in memory.
+    """
+    has_items = []
+    after_key = False
+    skip_next = False
+    skip_depth = 0
+    renaming = False
+    for _, event, value in events:
+        if skip_depth:
+            if event in _CONTAINER_STARTS:
+                skip_depth += 1
+            elif event in _CONTAINER_ENDS:
+                skip_depth -= 1
+            continue
+        if skip_next:
+            skip_next = False
+            if event in _CONTAINER_STARTS:
+                skip_depth = 1
+            continue
+        if event in _CONTAINER_ENDS:
+            has_items.pop()
+            yield _CONTAINER_ENDS[event]
+            continue
+        if event == "map_key":
+            if value == type_key:
+                if rename_map is None:
+                    skip_next = True
+                    continue
+                renaming = True
+            if has_items[-1]:
+                yield ","
+            has_items[-1] = True
+            yield json.dumps(value)
+            yield ":"
+            after_key = True
+            continue
+
+        if after_key:
+            after_key = False
+        elif has_items:
+            if has_items[-1]:
+                yield ","
+            has_items[-1] = True
+        if event in _CONTAINER_STARTS:
+            has_items.append(False)
+            yield _CONTAINER_STARTS[event]
+        elif event == "string":
+            if renaming:
+                value = rename_map.get(value, value)
+            yield json.dumps(value)
+        elif event == "boolean":
+            yield "true" if value else "false"
+        elif event == "null":
+            yield "null"
+        else:
+            yield str(value)
+        renaming = False
+
+
+def _fix_data(raw: bytes, fix: Callable[[dict], dict]) -> bytes:
+    data = orjson_loads(raw)
+    if data is not MISSING:
+        _iterate_data(data, fix)
+        try:
+            return orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            # Nested too deep for orjson. Fixing isn't idempotent, so start over from raw
+            pass
+    # Fix each dict as it is decoded instead of traversing the data again
+    data = json.loads(raw, object_hook=fix)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
 
 def _add_sub_parser_common_args(sub_parser):
     sub_parser.add_argument(
-        "-i", "--infile", type=argparse.FileType("r"), required=True
+        "-i",
+        "--infile",
+        type=argparse.FileType("rb", bufsize=_IO_BUFFER_SIZE),
+        required=True,
     )
     sub_parser.add_argument(
-        "-o", "--outfile", type=argparse.FileType("w"), required=True
+        "-o",
+        "--outfile",
+        type=argparse.FileType("wb", bufsize=_IO_BUFFER_SIZE),
+        required=True,
+    )
+    sub_parser.add_argument(
+        "-s",
+        "--stream",
+        action="store_true",
+        help="Process the data as a stream of tokens instead of loading it to memory (requires ijson)",
     )
 
 
-def _exec_remove_type_data(data, args):
-    remove_type_data(data, args.type_key)
+def _exec_remove_type_data(args) -> Callable[[dict], dict]:
+    return _type_key_remover(args.type_key)
 
 
-def _exec_rename_types(data, args):
-    rename_map = dict(r.split(":") for r in args.rename_map)
-    rename_types(data, args.type_key, rename_map)
+def _exec_rename_types(args) -> Callable[[dict], dict]:
+    return _type_renamer(args.type_key, _parse_rename_map(args))
 
 
-if __name__ == "__main__":
-    import argparse
-    import json
+def _stream_remove_type_data(args) -> Iterator[str]:
+    return _fix_json_events(ijson.parse(args.infile), args.type_key)
 
+
+def _stream_rename_types(args) -> Iterator[str]:
+    events = ijson.parse(args.infile)
+    return _fix_json_events(events, args.type_key, _parse_rename_map(args))
+
+
+def _parse_rename_map(args) -> Dict[str, str]:
+    return dict(r.split(":") for r in args.rename_map)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     parser = argparse.ArgumentParser(
         description="Fix serialized data to reflect changes in the code."
     )
@@ -72,7 +200,9 @@ if __name__ == "__main__":
     )
     _add_sub_parser_common_args(parser_del)
     parser_del.add_argument("-t", "--type-key", type=str, required=True)
-    parser_del.set_defaults(func=_exec_remove_type_data)
+    parser_del.set_defaults(
+        func=_exec_remove_type_data, stream_func=_stream_remove_type_data
+    )
 
     parser_rename = sub_parsers.add_parser(
         "rename_types", description="Renames types to reflect changes in the code."
@@ -85,15 +215,28 @@ if __name__ == "__main__":
         nargs="+",
         help="One or more arguments of <old-name>:<new-name>",
     )
-    parser_rename.set_defaults(func=_exec_rename_types)
+    parser_rename.set_defaults(
+        func=_exec_rename_types, stream_func=_stream_rename_types
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    # Before python 3.9, argparse opens "-" as the text mode stdin/stdout even for binary modes
+    args.infile = getattr(args.infile, "buffer", args.infile)
+    args.outfile = getattr(args.outfile, "buffer", args.outfile)
+    if args.stream and ijson is None:
+        parser.error("--stream requires ijson to be installed")
 
     try:
-        data = json.load(args.infile)
-        args.func(data, args)
-        json.dump(data, args.outfile)
+        fix = args.func(args)
+        if args.stream:
+            args.outfile.writelines(t.encode("utf-8") for t in args.stream_func(args))
+        else:
+            args.outfile.write(_fix_data(args.infile.read(), fix))
     finally:
         args.infile.close()
         args.outfile.flush()
         args.outfile.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,25 @@
 from datetime import date, time, datetime
+from typing import Any, Callable, Dict, Tuple
 
 from .utils import type_to_string, fully_qualified_string_to_type
 
+_date_to_ordinal = date.toordinal
+_date_from_ordinal = date.fromordinal
+_time_to_iso_format = time.isoformat
+_datetime_to_timestamp = datetime.timestamp
+_datetime_from_timestamp = datetime.fromtimestamp
+
 
 def serialize_date(d: date) -> dict:
-    return {"date": d.toordinal()}
+    return {"date": _date_to_ordinal(d)}
 
 
 def deserialize_date(d: dict) -> date:
-    return date.fromordinal(d["date"])
+    return _date_from_ordinal(d["date"])
 
 
 def serialize_time(t: time) -> dict:
-    return {"time": t.isoformat()}
+    return {"time": _time_to_iso_format(t)}
 
 
 def deserialize_time(d: dict) -> time:
@@ -20,11 +27,11 @@ def deserialize_time(d: dict) -> time:
 
 
 def serialize_datetime(d: datetime) -> dict:
-    return {"time": d.timestamp()}
+    return {"time": _datetime_to_timestamp(d)}
 
 
 def deserialize_datetime(d: dict) -> datetime:
-    return datetime.fromtimestamp(d["time"])
+    return _datetime_from_timestamp(d["time"])
 
 
 def serialize_type(obj: type) -> dict:
@@ -46,3 +53,11 @@ _time_from_iso_format = (
     if hasattr(time, "fromisoformat")
     else _time_from_iso_format_manually
 )
+
+# The default deserializers that only convert a single value, mapped to the key of
+# that value and the conversion function, so it can be called without the wrapper
+SCALAR_DESERIALIZERS: Dict[Callable[[dict], Any], Tuple[str, Callable]] = {
+    deserialize_date: ("date", _date_from_ordinal),
+    deserialize_time: ("time", _time_from_iso_format),
+    deserialize_datetime: ("time", _datetime_from_timestamp),
+}
@@ -1,9 +1,10 @@
 import datetime
 import json
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from enum import Enum
+from functools import lru_cache
 from inspect import signature
-from itertools import zip_longest
+from itertools import zip_longest, chain
 from typing import (
     Optional,
     Type,
@@ -13,9 +14,10 @@ from typing import (
     Any,
     TypeVar,
     Mapping,
-    Iterable,
     List,
     Tuple,
+    FrozenSet,
+    NamedTuple,
     overload,
 )
 
@@ -25,20 +27,38 @@ from .default_customs import (
     deserialize_time,
     deserialize_datetime,
     deserialize_date,
+    SCALAR_DESERIALIZERS,
 )
 from .objects import DictWithSerializedKeys
 from .utils import (
     resolve_types,
     get_fields,
+    Field,
     normalize_method,
     normalize_type,
-    is_obj_supported_primitive,
     SUPPORTED_PRIMITIVES,
     fully_qualified_string_to_type,
     NoneType,
+    is_obj_supported_primitive,
+    container_kind,
+    JSON_PRIMITIVE_TYPES,
+    MISSING,
+    ENUM,
+    MAPPING,
+    ITERABLE,
+    orjson_loads,
 )
 
 T = TypeVar("T")
+_MODULE_GLOBALS = globals()
+_FIELDS = "fields"
+_PRIMITIVE_KEY_PARSERS = {
+    int: int,
+    float: float,
+    bool: {"true": True, "false": False}.__getitem__,
+}
+_PARALLEL_LIST_THRESHOLD = 256
+_BUILTIN_TYPES = {t.__name__: t for t in (list, set, frozenset, tuple, dict, bytes)}
 
 
 class Deserializer:
@@ -53,6 +73,10 @@ class Deserializer:
         self._inheritance_deserializers: t = {
             type: deserialize_type,
         }
+        self._resolved_deserializers: Dict[
+            Tuple[Any, type],
+            Tuple[Optional[Callable], bool, Optional[Tuple[str, Callable]]],
+        ] = {}
 
     def register(
         self,
@@ -79,6 +103,7 @@ class Deserializer:
             self._custom_deserializers[t] = method
             if include_descendants:
                 self._inheritance_deserializers[t] = method
+            self._resolved_deserializers.clear()
             return deserialization_method
 
         return registration_method
@@ -95,12 +120,14 @@ class Deserializer:
         types_funcs = [
             (type_, self._custom_deserializers.pop(type_, None)) for type_ in types
         ]
+        self._resolved_deserializers.clear()
         try:
             yield
         finally:
             for type_, func in types_funcs:
                 if func is not None:
                     self._custom_deserializers[type_] = func
+            self._resolved_deserializers.clear()
 
     @overload
     def deserialize(
@@ -111,6 +138,7 @@ class Deserializer:
         allow_extra_fields: bool = False,
         ignore_custom_deserializer: bool = False,
         globals: Optional[Dict[str, Any]] = None,
+        parallelism: int = 1,
     ) -> T:
         ...
 
@@ -122,6 +150,7 @@ class Deserializer:
         allow_extra_fields: bool = False,
         ignore_custom_deserializer: bool = False,
         globals: Optional[Dict[str, Any]] = None,
+        parallelism: int = 1,
     ) -> T:
         """
         Deserializes an object from a dictionary or a list of dictionaries,
@@ -138,19 +167,35 @@ class Deserializer:
             (see ``unregister`` for ignoring custom deserializer for inner objects as well).
         :param globals: A dictionary from type name to type, most easily acquired using the built-in ``globals()``
             function.
+        :param parallelism: The number of threads used to deserialize the items of a long top level list. Only
+            worthwhile if custom deserializers release the GIL, e.g. by doing I/O.
         """
-        if globals:
+        if globals and any(isinstance(t, str) for t in self._custom_deserializers):
             self._custom_deserializers = resolve_types(
                 self._custom_deserializers, globals
             )
+            self._resolved_deserializers.clear()
 
+        all_globals = _MODULE_GLOBALS
+        if globals:
+            all_globals = dict(_MODULE_GLOBALS)
+            all_globals.update(globals)
+        if (
+            parallelism > 1
+            and isinstance(data, list)
+            and len(data) >= _PARALLEL_LIST_THRESHOLD
+        ):
+            return self._load_list_in_parallel(
+                data, obj_type, type_key, allow_extra_fields, all_globals, parallelism
+            )
         return self._deserialize(
             data,
             obj_type,
             type_key,
             allow_extra_fields,
-            globals or {},
+            all_globals,
             ignore_custom_deserializer,
+            add_ancestors=bool(globals),
         )
 
     def _deserialize(
@@ -159,45 +204,51 @@ class Deserializer:
         obj_type: Optional[Type[T]],
         type_key: Optional[str],
         allow_extra_fields: bool,
-        external_globals: Dict[str, Any],
+        all_globals: Mapping[str, Any],
         ignore_custom_deserializer: bool = False,
+        add_ancestors: bool = True,
     ):
-        all_globals = dict(globals())
-        all_globals.update(external_globals)
-        if is_obj_supported_primitive(data):
+        data_type = type(data)
+        if data_type in JSON_PRIMITIVE_TYPES:
             return data
-        if isinstance(data, list):
-            list_types = self._get_list_types(obj_type, data)
-            return [
-                self._deserialize(d, t, type_key, allow_extra_fields, all_globals)
-                for t, d in list_types
-            ]
+        if data_type is not dict:
+            # Subclasses of the json types
+            if data_type is not list and is_obj_supported_primitive(data):
+                return data
+            if data_type is list or isinstance(data, list):
+                return self._load_list(
+                    data, obj_type, type_key, allow_extra_fields, all_globals
+                )
 
         obj_type = self._get_object_type(obj_type, data, type_key, all_globals)
-        if type_key in data:
-            data.pop(type_key)
+        # The type key is left in the caller's data, and only removed from a copy
+        # where the whole dict is handed on
+        has_type_key = type_key in data
         real_type, generic_args = normalize_type(obj_type, all_globals)
-        if external_globals and isinstance(real_type, type):
-            bases = {real_type}
-            while bases:
-                all_globals.update((b.__name__, b) for b in bases)
-                bases = {ancestor for b in bases for ancestor in b.__bases__}
+        if add_ancestors and isinstance(real_type, type):
+            # Lets the fields refer to the class and its ancestors by name
+            all_globals = _GlobalsWithAncestors.add(all_globals, real_type)
 
         if not ignore_custom_deserializer:
-            deserialization_method = self._custom_deserializers.get(
-                obj_type, self._custom_deserializers.get(real_type)
+            method, inherited, scalar = self._get_custom_deserializer(
+                obj_type, real_type
             )
-            if deserialization_method:
-                return deserialization_method(data)
-            for base_class, method in self._inheritance_deserializers.items():
-                if issubclass(real_type, base_class):
+            if method:
+                if scalar is not None:
+                    key, convert = scalar
+                    return convert(data[key])
+                if has_type_key:
+                    data = _without_key(data, type_key)
+                if inherited:
                     return method(data, real_type)
+                return method(data)
 
         key_type = None
-        try:
-            fields = {f.name: f for f in get_fields(obj_type)}
-        except TypeError:
-            if issubclass(real_type, Enum):
+        kind = _deserialization_kind(obj_type, real_type)
+        if kind == _FIELDS:
+            plan = _type_plan(obj_type)
+        else:
+            if kind == ENUM:
                 value = data[ENUM_VALUE_KEY]
                 if isinstance(value, str):
                     try:
@@ -207,48 +258,190 @@ class Deserializer:
                             if e.name.lower() == value.lower():
                                 return e
                 return real_type(value)
-            elif issubclass(real_type, Mapping):
+            elif kind == MAPPING:
                 key_type = generic_args[0] if generic_args else None
                 if self._is_mapping_dict_with_serialized_keys(key_type, data):
                     obj_type = DictWithSerializedKeys
-                    fields = {f.name: f for f in get_fields(obj_type)}
+                    plan = _type_plan(obj_type)
                     value_type = generic_args[1] if generic_args else Any
-                    fields["data"].field_type = Dict[str, value_type]
+                    plan = plan._replace(
+                        field_types=tuple(
+                            (name, Dict[str, value_type] if name == "data" else t)
+                            for name, t in plan.field_types
+                        )
+                    )
                 else:
                     return self._load_mapping(
-                        data,
+                        _without_key(data, type_key) if has_type_key else data,
                         real_type,
                         generic_args,
                         type_key,
                         allow_extra_fields,
                         all_globals,
                     )
-            elif issubclass(real_type, Iterable):
+            elif kind == ITERABLE:
                 # If we got here it means data is not a list, so obj_type came from the data itself and is safe to use
                 return self._load_iterable(
                     data, obj_type, type_key, allow_extra_fields, all_globals
                 )
             elif real_type != obj_type:
                 return self._deserialize(
-                    data, real_type, type_key, allow_extra_fields, external_globals
+                    _without_key(data, type_key) if has_type_key else data,
+                    real_type,
+                    type_key,
+                    allow_extra_fields,
+                    all_globals,
                 )
             else:
-                raise
+                # Raises the error explaining why the type is not supported
+                get_fields(obj_type)
 
-        self._check_for_missing_fields(data, fields, obj_type)
-        self._check_for_extraneous_fields(data, fields, obj_type, allow_extra_fields)
-        self._load_inner_fields(data, fields, type_key, allow_extra_fields, all_globals)
+        # Not done with _load_fields, to keep the recursion one frame shallower
+        self._check_for_missing_fields(data, plan, obj_type)
+        self._check_for_extraneous_fields(
+            data, plan.fields, obj_type, allow_extra_fields, type_key
+        )
+        values = self._load_inner_fields(
+            data, plan.field_types, type_key, allow_extra_fields, all_globals
+        )
         if obj_type is DictWithSerializedKeys:
             return self._load_dict_with_serialized_keys(
-                obj_type(**data), key_type, type_key, allow_extra_fields, all_globals
+                obj_type(**values), key_type, type_key, allow_extra_fields, all_globals
             )
-        kwargs = {k: v for k, v in data.items() if fields[k].init}
+        return self._construct(obj_type, plan, values)
+
+    def _load_fields(
+        self, data, obj_type, plan, type_key, allow_extra_fields, all_globals
+    ) -> Dict[str, Any]:
+        self._check_for_missing_fields(data, plan, obj_type)
+        self._check_for_extraneous_fields(
+            data, plan.fields, obj_type, allow_extra_fields, type_key
+        )
+        return self._load_inner_fields(
+            data, plan.field_types, type_key, allow_extra_fields, all_globals
+        )
+
+    @staticmethod
+    def _construct(obj_type, plan: "_TypePlan", values: Dict[str, Any]):
+        if plan.positional_init and len(values) == len(plan.field_types):
+            # Every field is present, in the order of the constructor's parameters
+            return obj_type(*values.values())
+        non_init_fields = plan.non_init_field_names
+        if not non_init_fields:
+            return obj_type(**values)
+        kwargs = {k: v for k, v in values.items() if k not in non_init_fields}
         result = obj_type(**kwargs)
-        for k, v in data.items():
+        for k, v in values.items():
             if k not in kwargs:
                 setattr(result, k, v)
         return result
 
+    def _get_custom_deserializer(
+        self, obj_type, real_type: type
+    ) -> Tuple[Optional[Callable], bool, Optional[Tuple[str, Callable]]]:
+        key = (obj_type, real_type)
+        resolved = self._resolved_deserializers.get(key)
+        if resolved is None:
+            method = self._custom_deserializers.get(obj_type)
+            if method is None and real_type is not obj_type:
+                method = self._custom_deserializers.get(real_type)
+            inherited = False
+            if not method:
+                for base_class, base_method in self._inheritance_deserializers.items():
+                    if issubclass(real_type, base_class):
+                        method, inherited = base_method, True
+                        break
+            scalar = None
+            if method and not inherited:
+                # Compared by identity, since registered deserializers might not be hashable
+                scalar = next(
+                    (s for m, s in SCALAR_DESERIALIZERS.items() if m is method), None
+                )
+            resolved = self._resolved_deserializers[key] = (method, inherited, scalar)
+        return resolved
+
+    def _load_list(self, data, obj_type, type_key, allow_extra_fields, all_globals):
+        if all(type(d) in JSON_PRIMITIVE_TYPES for d in data):
+            # Primitives are returned as they are regardless of the type hint
+            return list(data)
+        return self._load_list_items(
+            self._get_list_types(obj_type, data),
+            type_key,
+            allow_extra_fields,
+            all_globals,
+        )
+
+    def _load_list_in_parallel(
+        self, data, obj_type, type_key, allow_extra_fields, all_globals, parallelism
+    ):
+        list_types = self._get_list_types(obj_type, data)
+        chunk_size = -(-len(list_types) // parallelism)
+        chunks = [
+            list_types[i : i + chunk_size]
+            for i in range(0, len(list_types), chunk_size)
+        ]
+        with ThreadPoolExecutor(parallelism) as executor:
+            results = executor.map(
+                lambda chunk: self._load_list_items(
+                    chunk, type_key, allow_extra_fields, all_globals
+                ),
+                chunks,
+            )
+            return list(chain.from_iterable(results))
+
+    def _load_list_items(self, list_types, type_key, allow_extra_fields, all_globals):
+        # Custom deserializers are resolved once per item type, not once per item
+        item_deserializers = {}
+        result = [None] * len(list_types)
+        for i, (t, d) in enumerate(list_types):
+            if type(d) in JSON_PRIMITIVE_TYPES:
+                # Primitive items are resolved in place, without a recursive call
+                result[i] = d
+                continue
+            if t is not None and isinstance(d, dict) and type_key not in d:
+                if t not in item_deserializers:
+                    item_deserializers[t] = self._get_item_deserializer(
+                        t, type_key, allow_extra_fields, all_globals
+                    )
+                method = item_deserializers[t]
+                if method is not None:
+                    result[i] = method(d)
+                    continue
+            result[i] = self._deserialize(
+                d, t, type_key, allow_extra_fields, all_globals
+            )
+        return result
+
+    def _get_item_deserializer(
+        self, item_type, type_key, allow_extra_fields, all_globals
+    ) -> Optional[Callable[[Dict[str, Any]], Any]]:
+        try:
+            real_type, _ = normalize_type(item_type, all_globals)
+        except TypeError:
+            return None
+        if not isinstance(real_type, type):
+            return None
+        method, inherited, _ = self._get_custom_deserializer(item_type, real_type)
+        if method and inherited:
+            return lambda d: method(d, real_type)
+        if method:
+            return method
+        if (
+            real_type is item_type
+            and _deserialization_kind(item_type, real_type) == _FIELDS
+        ):
+            # The items share a class, so its plan and globals are only looked up once
+            plan = _type_plan(real_type)
+            all_globals = _GlobalsWithAncestors.add(all_globals, real_type)
+            return lambda d: self._construct(
+                real_type,
+                plan,
+                self._load_fields(
+                    d, real_type, plan, type_key, allow_extra_fields, all_globals
+                ),
+            )
+        return None
+
     def _load_dict_with_serialized_keys(
         self,
         obj: DictWithSerializedKeys,
@@ -257,12 +450,21 @@ class Deserializer:
         allow_extra_fields,
         all_globals,
     ):
-        data = {
-            self._deserialize(
-                json.loads(k), key_type, type_key, allow_extra_fields, all_globals
-            ): v
-            for k, v in obj.data.items()
-        }
+        data = None
+        parse_key = _PRIMITIVE_KEY_PARSERS.get(key_type)
+        if parse_key is not None:
+            try:
+                data = {parse_key(k): v for k, v in obj.data.items()}
+            except (ValueError, KeyError):
+                # The keys don't match the type hint, so they are decoded as json
+                pass
+        if data is None:
+            data = {
+                self._deserialize(
+                    _json_loads(k), key_type, type_key, allow_extra_fields, all_globals
+                ): v
+                for k, v in obj.data.items()
+            }
         obj_type = Deserializer._get_type(obj.original_type, all_globals)
         return obj_type(data)
 
@@ -278,7 +480,9 @@ class Deserializer:
         val_type = generic_args[1] if len(generic_args) > 1 else None
         return obj_type(
             {
-                k: self._deserialize(
+                k: v
+                if type(v) in JSON_PRIMITIVE_TYPES
+                else self._deserialize(
                     v, val_type, type_key, allow_extra_fields, all_globals
                 )
                 for k, v in data.items()
@@ -292,13 +496,20 @@ class Deserializer:
         )
 
     def _load_inner_fields(
-        self, data, fields, type_key, allow_extra_fields, all_globals
-    ):
-        for key, value in data.items():
-            field = fields[key]
-            data[key] = self._deserialize(
-                value, field.field_type, type_key, allow_extra_fields, all_globals
-            )
+        self, data, field_types, type_key, allow_extra_fields, all_globals
+    ) -> Dict[str, Any]:
+        values = {}
+        for name, field_type in field_types:
+            value = data.get(name, MISSING)
+            if value is MISSING:
+                continue
+            if type(value) in JSON_PRIMITIVE_TYPES:
+                values[name] = value
+            else:
+                values[name] = self._deserialize(
+                    value, field_type, type_key, allow_extra_fields, all_globals
+                )
+        return values
 
     @classmethod
     def _is_mapping_dict_with_serialized_keys(cls, key_type, data):
@@ -311,20 +522,14 @@ class Deserializer:
         if key_type is str:
             return False
 
-        fields = {f.name: f for f in get_fields(DictWithSerializedKeys)}
-        try:
-            cls._check_for_missing_fields(data, fields, DictWithSerializedKeys)
-        except ValueError:
-            return False
-        return True
+        plan = _type_plan(DictWithSerializedKeys)
+        return data.keys() >= plan.mandatory_field_names
 
     @staticmethod
-    def _check_for_missing_fields(data, fields, obj_type):
-        missing = {
-            name
-            for name, field in fields.items()
-            if name not in data and field.mandatory
-        }
+    def _check_for_missing_fields(data, plan: "_TypePlan", obj_type):
+        if data.keys() >= plan.mandatory_field_names:
+            return
+        missing = plan.mandatory_field_names - data.keys()
         if missing:
             missing_str = '", "'.join(missing)
             raise ValueError(
@@ -332,16 +537,19 @@ class Deserializer:
             )
 
     @staticmethod
-    def _check_for_extraneous_fields(data, fields, obj_type, allow_extra_fields):
-        extraneous = set(data.keys()).difference(fields)
-        if extraneous and not allow_extra_fields:
+    def _check_for_extraneous_fields(
+        data, fields, obj_type, allow_extra_fields, type_key
+    ):
+        if allow_extra_fields or data.keys() <= fields.keys():
+            return
+        extraneous = data.keys() - fields.keys()
+        extraneous.discard(type_key)
+        if extraneous:
             extraneous_str = '", "'.join(extraneous)
             raise ValueError(
                 f'Found extraneous fields "{extraneous_str}" for object type "{obj_type.__name__}".'
                 f"Data is:\n{json.dumps(data)}"
             )
-        for e in extraneous:
-            data.pop(e)
 
     @staticmethod
     def _get_list_types(
@@ -368,7 +576,7 @@ class Deserializer:
         obj_type: Optional[Type[T]],
         data: Dict[str, Any],
         type_key: str,
-        all_globals: Dict[str, Any],
+        all_globals: Mapping[str, Any],
     ) -> type:
         if type_key in data:
             return Deserializer._get_type(data[type_key], all_globals)
@@ -379,23 +587,113 @@ class Deserializer:
         return obj_type
 
     @staticmethod
-    def _get_type(type_name: str, all_globals: Dict[str, Any]) -> type:
+    def _get_type(type_name: str, all_globals: Mapping[str, Any]) -> type:
         if "." not in type_name:
             return Deserializer._get_non_fully_qualified_type(type_name, all_globals)
         return fully_qualified_string_to_type(type_name)
 
     @staticmethod
     def _get_non_fully_qualified_type(
-        type_name: str, all_globals: Dict[str, Any]
+        type_name: str, all_globals: Mapping[str, Any]
     ) -> type:
-        if type_name == "list":
-            return list
-        if type_name == "set":
-            return set
-        if type_name == "tuple":
-            return tuple
-        if type_name == "dict":
-            return dict
-        if type_name not in all_globals:
-            raise ValueError(f"type {type_name} not found in globals.")
-        return all_globals[type_name]
+        t = _BUILTIN_TYPES.get(type_name)
+        if t is not None:
+            return t
+        try:
+            return all_globals[type_name]
+        except KeyError:
+            raise ValueError(f"type {type_name} not found in globals.") from None
+
+
+def _without_key(data: Dict[str, Any], key: str) -> Dict[str, Any]:
+    return {k: v for k, v in data.items() if k != key}
+
+
+def _json_loads(s: str):
+    data = orjson_loads(s)
+    return json.loads(s) if data is MISSING else data
+
+
+class _GlobalsWithAncestors(Mapping):
+    """
+    Globals enriched with the names of the classes of all enclosing objects and their ancestors.
+    The ancestors are only collected when a name is looked up.
+    """
+
+    __slots__ = ("_globals", "_types", "_ancestors")
+
+    def __init__(self, all_globals: Mapping[str, Any], types: Tuple[type, ...]) -> None:
+        super().__init__()
+        self._globals = all_globals
+        self._types = types
+        self._ancestors: Optional[Dict[str, type]] = None
+
+    @classmethod
+    def add(cls, all_globals: Mapping[str, Any], t: type) -> "_GlobalsWithAncestors":
+        # Nested objects extend a single wrapper, so a lookup doesn't go through every level
+        if type(all_globals) is not cls:
+            return cls(all_globals, (t,))
+        if t in all_globals._types:
+            return all_globals
+        return cls(all_globals._globals, all_globals._types + (t,))
+
+    def _get_ancestors(self) -> Dict[str, type]:
+        if self._ancestors is None:
+            # Names of inner classes take precedence over those of outer ones
+            self._ancestors = {a.__name__: a for t in self._types for a in t.__mro__}
+        return self._ancestors
+
+    def __getitem__(self, name: str) -> Any:
+        ancestors = self._get_ancestors()
+        if name in ancestors:
+            return ancestors[name]
+        return self._globals[name]
+
+    def __iter__(self):
+        return iter(set(self._globals).union(self._get_ancestors()))
+
+    def __len__(self) -> int:
+        return len(set(self._globals).union(self._get_ancestors()))
+
+
+class _TypePlan(NamedTuple):
+    fields: Dict[str, Field]
+    field_types: Tuple[Tuple[str, Any], ...]
+    mandatory_field_names: FrozenSet[str]
+    non_init_field_names: FrozenSet[str]
+    positional_init: bool
+
+
+@lru_cache(None)
+def _type_plan(obj_type: type) -> _TypePlan:
+    fields = get_fields(obj_type)
+    return _TypePlan(
+        {f.name: f for f in fields},
+        tuple((f.name, f.field_type) for f in fields),
+        frozenset(f.name for f in fields if f.mandatory),
+        frozenset(f.name for f in fields if not f.init),
+        _accepts_fields_positionally(obj_type, fields),
+    )
+
+
+def _accepts_fields_positionally(obj_type: type, fields: Tuple[Field, ...]) -> bool:
+    try:
+        params = list(signature(obj_type).parameters.values())
+    except (TypeError, ValueError):
+        return False
+    # attrs strips the leading underscores of private attributes in __init__
+    return len(params) == len(fields) and all(
+        f.init
+        and p.kind is p.POSITIONAL_OR_KEYWORD
+        and p.name in (f.name, f.name.lstrip("_"))
+        for p, f in zip(params, fields)
+    )
+
+
+@lru_cache(None)
+def _deserialization_kind(obj_type, real_type: type) -> Optional[str]:
+    try:
+        get_fields(obj_type)
+        return _FIELDS
+    except TypeError:
+        return container_kind(real_type)
@@ -1,7 +1,7 @@
 from attr import attrs, attrib
 
 
-@attrs
+@attrs(slots=True, frozen=True)
 class DictWithSerializedKeys:
     data: dict = attrib()
     original_type: str = attrib()
@@ -2,9 +2,10 @@ import datetime
 import json
 import warnings
 from contextlib import contextmanager
-from enum import Enum
+from functools import lru_cache
 from inspect import signature
-from typing import Dict, Any, Union, Mapping, Iterable, Callable, Optional
+from operator import attrgetter
+from typing import Dict, Any, Union, Mapping, Iterable, Callable, Optional, Tuple
 
 from .constants import ENUM_VALUE_KEY, ITERABLE_VALUE_KEY
 from .default_customs import (
@@ -22,8 +23,17 @@ from .utils import (
     normalize_method,
     Field,
     is_obj_supported_primitive,
+    container_kind,
+    JSON_PRIMITIVE_TYPES,
+    MISSING,
+    ENUM,
+    MAPPING,
+    ITERABLE,
 )
 
+_BUILTIN_ITERABLE_TYPES = frozenset((list, tuple, set, frozenset))
+_DATA_CLASS = "data_class"
+
 
 class Serializer:
     def __init__(self) -> None:
@@ -36,6 +46,10 @@ class Serializer:
         self._inheritance_serializers: Dict[type, Callable[[Any], Dict[str, Any]]] = {
             type: serialize_type,
         }
+        self._resolved_serializers: Dict[
+            type, Optional[Callable[[Any], Dict[str, Any]]]
+        ] = {}
+        self._plain_primitive_types = JSON_PRIMITIVE_TYPES
 
     def register(
         self, type_to_register: Optional[type] = None, include_descendants: bool = False
@@ -60,6 +74,7 @@ class Serializer:
             self._custom_serializers[t] = method
             if include_descendants:
                 self._inheritance_serializers[t] = method
+            self._reset_resolved_serializers()
             return serialization_method
 
         return registration_method
@@ -76,14 +91,23 @@ class Serializer:
         types_funcs = [
             (type_, self._custom_serializers.pop(type_, None)) for type_ in types
         ]
+        self._reset_resolved_serializers()
         try:
             yield
         finally:
             for type_, func in types_funcs:
                 if func is not None:
                     self._custom_serializers[type_] = func
+            self._reset_resolved_serializers()
         pass
 
+    def _reset_resolved_serializers(self) -> None:
+        self._resolved_serializers.clear()
+        # Primitives without a custom serializer are returned as they are, without looking one up
+        self._plain_primitive_types = frozenset(
+            t for t in JSON_PRIMITIVE_TYPES if self._get_custom_serializer(t) is None
+        )
+
     def serialize(
         self,
         obj,
@@ -110,13 +134,14 @@ class Serializer:
             ('Foo' instead of Foo), this parameter should be a dictionary from type name to type, most easily
             acquired using the built-in ``globals()`` function.
         """
-        if is_obj_supported_primitive(obj):
+        if type(obj) in JSON_PRIMITIVE_TYPES or is_obj_supported_primitive(obj):
             return obj
 
-        if globals:
+        if globals and any(isinstance(t, str) for t in self._custom_serializers):
             self._custom_serializers = resolve_types(self._custom_serializers, globals)
+            self._reset_resolved_serializers()
 
-        result = self._serialize(
+        return self._serialize(
             obj,
             type_key,
             fully_qualified_types,
@@ -124,8 +149,6 @@ class Serializer:
             stringify_dict_keys,
             inner=False,
         )
-        result = _convert_to_json_serializable(result)
-        return result
 
     def _serialize(
         self,
@@ -136,16 +159,14 @@ class Serializer:
         stringify_dict_keys,
         inner=True,
     ):
-        serialization_method = self._custom_serializers.get(type(obj))
-        if serialization_method is None:
-            for base_class, method in self._inheritance_serializers.items():
-                if isinstance(obj, base_class):
-                    serialization_method = method
-                    break
+        if type(obj) in self._plain_primitive_types:
+            return obj
+        serialization_method = self._get_custom_serializer(type(obj))
         if serialization_method is not None:
-            result = serialization_method(obj)
+            result = _convert_to_json_serializable(serialization_method(obj))
         else:
-            try:
+            kind = _serialization_kind(type(obj))
+            if kind == _DATA_CLASS:
                 result = self._serialize_data_class(
                     obj,
                     type_key,
@@ -153,37 +174,65 @@ class Serializer:
                     preserve_iterable_types,
                     stringify_dict_keys,
                 )
-            except TypeError:
-                if isinstance(obj, Enum):
-                    result = {ENUM_VALUE_KEY: obj.name}
-                elif isinstance(obj, Mapping):
-                    result = self._serialize_mapping(
-                        obj,
-                        type_key,
-                        fully_qualified_types,
-                        preserve_iterable_types,
-                        stringify_dict_keys,
-                    )
-                elif isinstance(obj, Iterable) and not isinstance(obj, str):
-                    serialized = self._serialize_iterable(
-                        obj,
-                        type_key,
-                        fully_qualified_types,
-                        preserve_iterable_types,
-                        stringify_dict_keys,
-                    )
-                    if isinstance(obj, list) or not preserve_iterable_types:
-                        return serialized
-                    result = {ITERABLE_VALUE_KEY: serialized}
-                elif not inner:
-                    raise
-                else:
-                    return obj
+            elif kind == ENUM:
+                result = {ENUM_VALUE_KEY: obj.name}
+            elif kind == MAPPING:
+                result = self._serialize_mapping(
+                    obj,
+                    type_key,
+                    fully_qualified_types,
+                    preserve_iterable_types,
+                    stringify_dict_keys,
+                )
+            elif kind == ITERABLE:
+                serialized = self._serialize_iterable(
+                    obj,
+                    type_key,
+                    fully_qualified_types,
+                    preserve_iterable_types,
+                    stringify_dict_keys,
+                )
+                if isinstance(obj, list) or not preserve_iterable_types:
+                    return serialized
+                result = {ITERABLE_VALUE_KEY: serialized}
+            elif not inner:
+                # Raises the error explaining why the type is not supported
+                get_fields(type(obj))
+            elif is_obj_supported_primitive(obj):
+                return obj
+            else:
+                raise TypeError(
+                    f'Found object of type "{type(obj).__name__}" which cannot be serialized'
+                )
 
         if type_key is not None and type_key not in result:
-            result[type_key] = self._get_type_data(obj, fully_qualified_types)
+            result[type_key] = type_to_string(type(obj), fully_qualified_types)
         return result
 
+    def _get_custom_serializer(
+        self, obj_type: type
+    ) -> Optional[Callable[[Any], Dict[str, Any]]]:
+        method = self._resolved_serializers.get(obj_type, MISSING)
+        if method is MISSING:
+            method = self._custom_serializers.get(obj_type)
+            if method is None:
+                # The most specific registered base class wins
+                for base_class in obj_type.__mro__:
+                    method = self._inheritance_serializers.get(base_class)
+                    if method is not None:
+                        break
+            if method is None:
+                # Virtual base classes (e.g. ABCs) are not in the MRO
+                for base_class, base_method in self._inheritance_serializers.items():
+                    # Forward references that weren't resolved yet can't match
+                    if not isinstance(base_class, str) and issubclass(
+                        obj_type, base_class
+                    ):
+                        method = base_method
+                        break
+            self._resolved_serializers[obj_type] = method
+        return method
+
     def _serialize_data_class(
         self,
         obj,
@@ -192,20 +241,22 @@ class Serializer:
         preserve_iterable_types,
         stringify_dict_keys,
     ):
-        fields = get_fields(type(obj))
+        obj_type = type(obj)
+        names, get_values = _field_values_getter(obj_type)
         result = {
-            f.name: self._serialize(
-                getattr(obj, f.name),
+            name: self._serialize(
+                value,
                 type_key,
                 fully_qualified_types,
                 preserve_iterable_types,
                 stringify_dict_keys,
             )
-            for f in fields
+            for name, value in zip(names, get_values(obj))
         }
-        self._warn_for_possible_problems_in_deserialization(
-            obj, fields, result, type_key is not None
-        )
+        if type_key is None or _fields_with_converter_or_validator(obj_type):
+            self._warn_for_possible_problems_in_deserialization(
+                obj, get_fields(obj_type), result, type_key is not None
+            )
         return result
 
     def _serialize_iterable(
@@ -216,6 +267,11 @@ class Serializer:
         preserve_iterable_types,
         stringify_dict_keys,
     ):
+        plain_primitive_types = self._plain_primitive_types
+        if type(obj) in _BUILTIN_ITERABLE_TYPES and all(
+            type(item) in plain_primitive_types for item in obj
+        ):
+            return list(obj)
         return [
             self._serialize(
                 item,
@@ -237,36 +293,33 @@ class Serializer:
     ):
         result = self._serialize_mapping_values(
             obj,
-            type_key=type_key,
-            fully_qualified_types=fully_qualified_types,
-            preserve_iterable_types=preserve_iterable_types,
-            stringify_dict_keys=stringify_dict_keys,
+            type_key,
+            fully_qualified_types,
+            preserve_iterable_types,
+            stringify_dict_keys,
         )
-        if any(not self._key_ok(k, stringify_dict_keys) for k in result.keys()):
+        if not self._keys_ok(result.keys(), stringify_dict_keys):
             obj_type = self._get_type_data(obj, fully_qualified_types)
             d = self._serialize_complex_keys(
                 result, obj_type, type_key, fully_qualified_types
             )
-            result = self._serialize(
-                d,
-                type_key=type_key,
-                fully_qualified_types=fully_qualified_types,
-                preserve_iterable_types=preserve_iterable_types,
-                stringify_dict_keys=stringify_dict_keys,
-            )
+            # The values are already serialized, so only the type data is missing
+            result = {"data": d.data, "original_type": d.original_type}
+            if type_key is not None:
+                d.data[type_key] = type_to_string(dict, fully_qualified_types)
+                result[type_key] = type_to_string(
+                    DictWithSerializedKeys, fully_qualified_types
+                )
         return result
 
     def _serialize_complex_keys(
         self, obj: dict, obj_type: str, type_key, fully_qualified_types
     ):
         def serialize_key(k):
+            if type(k) in self._plain_primitive_types:
+                return json.dumps(k)
             return json.dumps(
-                self.serialize(
-                    k,
-                    type_key=type_key,
-                    fully_qualified_types=fully_qualified_types,
-                    preserve_iterable_types=True,
-                )
+                self._serialize(k, type_key, fully_qualified_types, True, True)
             )
 
         try:
@@ -285,6 +338,11 @@ class Serializer:
         preserve_iterable_types,
         stringify_dict_keys,
     ):
+        plain_primitive_types = self._plain_primitive_types
+        if type(obj) is dict and all(
+            type(v) in plain_primitive_types for v in obj.values()
+        ):
+            return dict(obj)
         return {
             k: self._serialize(
                 v,
@@ -296,13 +354,11 @@ class Serializer:
             for k, v in obj.items()
         }
 
-    @classmethod
-    def _key_ok(cls, key, stringify_dict_keys):
-        return (
-            isinstance(key, str)
-            if stringify_dict_keys
-            else is_obj_supported_primitive(key)
-        )
+    @staticmethod
+    def _keys_ok(keys: Iterable, stringify_dict_keys) -> bool:
+        if stringify_dict_keys:
+            return all(isinstance(k, str) for k in keys)
+        return all(is_obj_supported_primitive(k) for k in keys)
 
     @classmethod
     def _warn_for_possible_problems_in_deserialization(
@@ -312,19 +368,24 @@ class Serializer:
         data: Dict[str, Any],
         type_key_present: bool,
     ) -> None:
-        for f in fields:
-            value = data[f.name]
-            if not type_key_present:
-                cls._check_for_unknown_dicts(f, value, obj.__class__.__name__)
+        obj_class_name = obj.__class__.__name__
+        if not type_key_present:
+            for f in fields:
+                value = data[f.name]
+                # Only dicts and lists of dicts can be missing their type
+                if type(value) not in JSON_PRIMITIVE_TYPES:
+                    cls._check_for_unknown_dicts(f, value, obj_class_name)
+        for f in _fields_with_converter_or_validator(type(obj)):
             cls._check_for_unconvertables_or_invalid(
-                obj, f, value, obj.__class__.__name__
+                obj, f, data[f.name], obj_class_name
             )
 
     @classmethod
     def _check_for_unknown_dicts(cls, f, value, obj_class_name):
         try:
-            real_type, generic_args = normalize_type(f.field_type)
+            real_type, generic_args = _normalize_field_type(f.field_type)
         except TypeError:
+            # Unhashable type hint
             real_type = generic_args = None
 
         if isinstance(value, list) and value:
@@ -354,7 +415,7 @@ class Serializer:
         if f.converter is not None and not isinstance(value, dict):
             try:
                 value = f.converter(value)
-            except:
+            except Exception:
                 cls._warn(
                     f'Field "{f.name}" in obj "{obj_class_name}" has value {value} that could not be converted using its converter'
                 )
@@ -363,7 +424,7 @@ class Serializer:
         if f.validator is not None and not isinstance(value, dict):
             try:
                 f.validator(obj, f, value)
-            except:
+            except Exception:
                 cls._warn(
                     f'Field "{f.name}" in obj "{obj.__class__.__name__}" has value {value} that doesn\'t match this field\'s validator'
                 )
@@ -384,12 +445,61 @@ class Serializer:
 
 
 def _convert_to_json_serializable(obj) -> Union[int, float, str, list, dict, None]:
-    if is_obj_supported_primitive(obj):
+    obj_type = type(obj)
+    if obj_type in JSON_PRIMITIVE_TYPES:
+        return obj
+    # Already serializable containers are kept as they are instead of being copied
+    if obj_type is dict and all(type(v) in JSON_PRIMITIVE_TYPES for v in obj.values()):
+        return obj
+    if obj_type is list and all(type(i) in JSON_PRIMITIVE_TYPES for i in obj):
+        return obj
+    # Concrete builtin containers are checked before the slower ABC checks
+    is_dict = obj_type is dict
+    is_builtin_iterable = obj_type in _BUILTIN_ITERABLE_TYPES
+    if not is_dict and not is_builtin_iterable and is_obj_supported_primitive(obj):
         return obj
-    if isinstance(obj, Mapping):
+    if is_dict or isinstance(obj, Mapping):
         return {key: _convert_to_json_serializable(value) for key, value in obj.items()}
-    if isinstance(obj, Iterable):
+    if is_builtin_iterable or isinstance(obj, Iterable):
         return [_convert_to_json_serializable(item) for item in obj]
     raise TypeError(
         f'Found object of type "{type(obj).__name__}" which cannot be serialized'
     )
+
+
+@lru_cache(None)
+def _field_values_getter(
+    t: type,
+) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+    names = tuple(f.name for f in get_fields(t))
+    if not names:
+        return names, lambda obj: ()
+    if len(names) == 1:
+        get_value = attrgetter(names[0])
+        return names, lambda obj: (get_value(obj),)
+    # Reads all the fields in a single call
+    return names, attrgetter(*names)
+
+
+@lru_cache(None)
+def _normalize_field_type(field_type) -> Tuple[Optional[type], Optional[tuple]]:
+    try:
+        return normalize_type(field_type)
+    except TypeError:
+        return None, None
+
+
+@lru_cache(None)
+def _fields_with_converter_or_validator(t: type) -> Tuple[Field, ...]:
+    return tuple(
+        f for f in get_fields(t) if f.converter is not None or f.validator is not None
+    )
+
+
+@lru_cache(None)
+def _serialization_kind(t: type) -> Optional[str]:
+    try:
+        get_fields(t)
+        return _DATA_CLASS
+    except TypeError:
+        return container_kind(t)
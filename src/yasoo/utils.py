@@ -1,10 +1,16 @@
+import re
+from enum import Enum
 from functools import lru_cache
 from importlib import import_module
-from typing import Dict, Any, Union, List, Optional, Tuple
+from typing import Dict, Any, Union, Optional, Tuple, NamedTuple, Mapping, Iterable
 
 import attr
 from attr.exceptions import NotAnAttrsClassError
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
 try:
     import dataclasses
 except ModuleNotFoundError:
@@ -53,18 +59,24 @@ except ImportError:
 
 
 NoneType = type(None)
-SUPPORTED_PRIMITIVES = {bool, int, float, str}
+SUPPORTED_PRIMITIVES = frozenset((bool, int, float, str))
 _SUPPORTED_PRIMITIVES = tuple(SUPPORTED_PRIMITIVES)
+JSON_PRIMITIVE_TYPES = SUPPORTED_PRIMITIVES | {NoneType}
+MISSING = object()
+ENUM = "enum"
+MAPPING = "mapping"
+ITERABLE = "iterable"
+_LONG_DIGITS_PATTERN = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES_PATTERN = re.compile(rb"\d{19}")
 
 
-@attr.attrs
-class Field:
-    name: str = attr.attrib()
-    field_type: type = attr.attrib()
-    mandatory: bool = attr.attrib()
-    init: bool = attr.attrib()
-    validator: Optional[callable] = attr.attrib(default=None)
-    converter: Optional[callable] = attr.attrib(default=None)
+class Field(NamedTuple):
+    name: str
+    field_type: type
+    mandatory: bool
+    init: bool
+    validator: Optional[callable] = None
+    converter: Optional[callable] = None
 
 
 def resolve_types(
@@ -74,9 +86,9 @@ def resolve_types(
 
 
 @lru_cache(None)
-def get_fields(obj_type: type) -> List[Field]:
+def get_fields(obj_type: type) -> Tuple[Field, ...]:
     try:
-        return [
+        return tuple(
             Field(
                 f.name,
                 f.type,
@@ -86,13 +98,13 @@ def get_fields(obj_type: type) -> List[Field]:
                 f.converter,
             )
             for f in attr.fields(obj_type)
-        ]
+        )
     except NotAnAttrsClassError:
         try:
-            return [
+            return tuple(
                 Field(f.name, f.type, _dataclass_field_mandatory(f), f.init)
                 for f in dataclasses.fields(obj_type)
-            ]
+            )
         except (TypeError, AttributeError):
             pass
     raise TypeError("can only serialize attrs or dataclass classes")
@@ -105,18 +117,21 @@ def normalize_method(method) -> callable:
 def normalize_type(
     t: Union[type, GenericType], all_globals: Optional[dict] = None
 ) -> Tuple[type, tuple]:
-    all_globals = all_globals or {}
+    t = _unwrap_type(t)
+    if isinstance(t, str) and all_globals is not None and t in all_globals:
+        return all_globals[t], tuple()
+    return _normalize_type(t)
+
+
+@lru_cache(None)
+def _unwrap_type(t: Union[type, GenericType]) -> Union[type, GenericType, str, None]:
     if t == Any:
-        t = None
+        return None
     if _is_optional(t):
-        return normalize_type(
-            next(a for a in t.__args__ if a is not NoneType), all_globals
-        )
+        return _unwrap_type(next(a for a in t.__args__ if a is not NoneType))
     if isinstance(t, ForwardRef):
-        t = t.__forward_arg__
-    if isinstance(t, str) and t in all_globals:
-        return all_globals[t], tuple()
-    return _normalize_type(t)
+        return t.__forward_arg__
+    return t
 
 
 @lru_cache(None)
@@ -138,19 +153,48 @@ def is_obj_supported_primitive(obj):
     return isinstance(obj, _SUPPORTED_PRIMITIVES) or obj is None
 
 
+def orjson_loads(s: Union[str, bytes]) -> Any:
+    """
+    Decodes json using orjson, if it's installed and decodes the data the same as ``json.loads``.
+
+    :return: The decoded data, or ``MISSING`` if ``json.loads`` should be used.
+    """
+    if orjson is None:
+        return MISSING
+    # orjson silently converts integers that don't fit in 64 bits to floats
+    pattern = _LONG_DIGITS_PATTERN if isinstance(s, str) else _LONG_DIGITS_BYTES_PATTERN
+    if pattern.search(s) is not None:
+        return MISSING
+    try:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError:
+        # Not strict json (e.g. NaN), but json.dumps might have written it
+        return MISSING
+
+
+@lru_cache(None)
+def container_kind(t: type) -> Optional[str]:
+    # issubclass against the ABCs is slow, so it's only done once per type
+    if issubclass(t, Enum):
+        return ENUM
+    if issubclass(t, Mapping):
+        return MAPPING
+    if issubclass(t, Iterable) and not issubclass(t, str):
+        return ITERABLE
+    return None
+
+
 @lru_cache(None)
 def type_to_string(t: type, fully_qualified: bool) -> str:
-    name = t.__name__
     if fully_qualified:
-        return ".".join((t.__module__, name))
+        return f"{t.__module__}.{t.__name__}"
     else:
-        return name
+        return t.__name__
 
 
 @lru_cache(None)
 def fully_qualified_string_to_type(fully_qualified_type_name: str) -> type:
-    module_name = fully_qualified_type_name[: fully_qualified_type_name.rindex(".")]
-    class_name = fully_qualified_type_name[len(module_name) + 1 :]
+    module_name, _, class_name = fully_qualified_type_name.rpartition(".")
     return getattr(import_module(module_name), class_name)
 
 
@@ -20,6 +20,21 @@ class TestCommon(TestCase):
         self.assertIsInstance(restored, MyMapping)
         self.assertEqual(mapping, restored)
 
+    def test_serialized_dict_keys_with_big_ints(self):
+        original = {(2 ** 70, 1.5): 1, (-2 ** 63 - 1, 0.5): 2}
+        restored = deserialize(serialize(original))
+        self.assertEqual(original, restored)
+        self.assertTrue(all(isinstance(k[0], int) for k in restored))
+
+    def test_stringified_dict_keys_with_primitive_key_type_hint(self):
+        for original, obj_type in [({1: 'a', -2: 'b'}, Dict[int, str]),
+                                   ({1.5: 'a', float('inf'): 'b'}, Dict[float, str]),
+                                   ({True: 'a', False: 'b'}, Dict[bool, str])]:
+            restored = deserialize(serialize(original, type_key=None), obj_type=obj_type)
+            self.assertEqual(original, restored)
+            for k in restored:
+                self.assertIsInstance(k, obj_type.__args__[0])
+
     def test_stringified_dict_key_types(self):
         original = {'a': 1, 2: 'b', True: 3}
         serialized = serialize(original, stringify_dict_keys=True)
@@ -1,4 +1,4 @@
-from typing import Sequence, Dict, Optional
+from typing import Sequence, Dict, Optional, List
 from unittest import TestCase
 from unittest.mock import MagicMock
 
@@ -178,3 +178,71 @@ class TestAttrsDeserialization(TestCase):
         self.assertIsInstance(f, Foo)
         self.assertEqual(5, f.a)
         self.assertEqual('x', f.b)
+
+    def test_attr_deserialization_with_kw_only_field(self):
+        @attrs
+        class Foo:
+            a: int = attrib()
+            b: str = attrib(kw_only=True)
+
+        f = deserialize({'b': 'x', 'a': 5}, Foo, globals=locals())
+        self.assertIsInstance(f, Foo)
+        self.assertEqual(5, f.a)
+        self.assertEqual('x', f.b)
+
+    def test_attr_deserialization_with_custom_init(self):
+        @attrs(init=False)
+        class Foo:
+            a: int = attrib()
+            b: int = attrib()
+
+            def __init__(self, b, a):
+                self.a = a
+                self.b = b
+
+        f = deserialize({'a': 1, 'b': 2}, Foo, globals=locals())
+        self.assertEqual(1, f.a)
+        self.assertEqual(2, f.b)
+
+    def test_attr_deserialization_of_list_with_item_type_hint(self):
+        @attrs
+        class Foo:
+            a: int = attrib()
+
+        foos = deserialize([{'a': 1}, {'a': 2}], List[Foo], type_key=None, globals=locals())
+        self.assertEqual([Foo(1), Foo(2)], foos)
+        self.assertRaises(ValueError, deserialize, [{'a': 1}, {}], List[Foo], type_key=None)
+
+    def test_attr_deserialization_with_nested_self_reference_without_globals(self):
+        @attrs
+        class Node:
+            a: int = attrib()
+            next: Optional['Node'] = attrib(default=None)
+
+        @attrs
+        class Holder:
+            node: Node = attrib()
+
+        data = {'node': {'a': 1, 'next': {'a': 2, 'next': {'a': 3}}}}
+        holder = deserialize(data, Holder, type_key=None)
+        self.assertEqual(Holder(Node(1, Node(2, Node(3)))), holder)
+
+    def test_attr_deserialization_of_deeply_nested_data_with_forward_references(self):
+        @attrs
+        class Other:
+            a: int = attrib()
+
+        @attrs
+        class Node:
+            other: Optional['Other'] = attrib(default=None)
+            next: Optional['Node'] = attrib(default=None)
+
+        data = {}
+        for _ in range(250):
+            data = {'other': {'a': 1}, 'next': data}
+        node = deserialize(data, Node, type_key=None, globals=locals())
+        depth = 0
+        while node.next is not None:
+            self.assertEqual(Other(1), node.other)
+            node, depth = node.next, depth + 1
+        self.assertEqual(250, depth)
@@ -1,7 +1,18 @@
-from unittest import TestCase
+import json
+import math
+import os
+from io import BytesIO, TextIOWrapper
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+try:
+    import ijson
+except ModuleNotFoundError:
+    ijson = None
 
 from yasoo import serialize, deserialize, serializer
-from yasoo.data_fixer import remove_type_data, rename_types
+from yasoo.data_fixer import remove_type_data, rename_types, main, _fix_data, _fix_json_events, _type_key_remover, _type_renamer
 
 
 class TestDataFixer(TestCase):
@@ -34,3 +45,104 @@ class TestDataFixer(TestCase):
         rename_types(data, type_key, {'Foo': 'builtins.dict'})
         restored = deserialize(data, type_key=type_key)
         self.assertEqual(original, restored)
+
+    def test_fix_data_with_big_ints_and_nan(self):
+        remove_type_key = _type_key_remover('__type')
+        raw = b'{"__type": "Foo", "big": 123456789012345678901234567890, "small": -1}'
+        fixed = json.loads(_fix_data(raw, remove_type_key))
+        self.assertEqual({'big': 123456789012345678901234567890, 'small': -1}, fixed)
+
+        raw = b'{"__type": "Foo", "nan": NaN, "inf": [Infinity, -Infinity]}'
+        fixed = json.loads(_fix_data(raw, remove_type_key))
+        self.assertEqual(['nan', 'inf'], list(fixed))
+        self.assertTrue(math.isnan(fixed['nan']))
+        self.assertEqual([math.inf, -math.inf], fixed['inf'])
+
+    def test_fix_data_with_lone_surrogates(self):
+        raw = b'{"__type": "A", "\\udcff": ["\\ud800", "\\u00e9"]}'
+        fixed = _fix_data(raw, _type_key_remover('__type'))
+        self.assertEqual({'\udcff': ['\ud800', '\u00e9']}, json.loads(fixed))
+
+    @skipIf(ijson is None, 'requires ijson')
+    def test_fix_json_events_with_lone_surrogates(self):
+        # The yajl2 backends can't decode lone surrogates
+        events = ijson.get_backend('python').parse(BytesIO(b'{"__type": "A", "\\udcff": ["\\ud800"]}'))
+        fixed = ''.join(_fix_json_events(events, '__type')).encode('utf-8')
+        self.assertEqual({'\udcff': ['\ud800']}, json.loads(fixed))
+
+    def test_fix_data_with_deep_nesting(self):
+        raw = ('[' * 300 + '{"__type": "A", "a": 1}' + ']' * 300).encode('utf-8')
+        fixed = _fix_data(raw, _type_renamer('__type', {'A': 'B', 'B': 'C'}))
+        self.assertEqual(('[' * 300 + '{"__type":"B","a":1}' + ']' * 300).encode('utf-8'), fixed)
+
+    @skipIf(ijson is None, 'requires ijson')
+    def test_fix_json_events_removes_type_key_with_container_value(self):
+        data = {'__type': {'x': [1, {'y': 2}], 'z': []}, 'a': [{'__type': 'A', 'b': {}}]}
+        self.assertEqual({'a': [{'b': {}}]}, self._fix_events(data))
+
+    @skipIf(ijson is None, 'requires ijson')
+    def test_fix_json_events_renames_nested_types(self):
+        data = {'__type': 'A', 'b': {'__type': 'B', 'c': [{'__type': 'A', 'd': 'A'}]}}
+        expected = {'__type': 'X', 'b': {'__type': 'B', 'c': [{'__type': 'X', 'd': 'A'}]}}
+        self.assertEqual(expected, self._fix_events(data, {'A': 'X'}))
+
+    @skipIf(ijson is None, 'requires ijson')
+    def test_fix_json_events_with_escaped_and_non_ascii_strings(self):
+        data = {'__type': 'A', 'q"\\': 'a"b\\c\n\t\u00e9\u4e2d\U0001f600', '\u00e9': ['\x00']}
+        expected = {k: v for k, v in data.items() if k != '__type'}
+        self.assertEqual(expected, self._fix_events(data))
+
+    @skipIf(ijson is None, 'requires ijson')
+    def test_fix_json_events_with_empty_containers(self):
+        self.assertEqual({}, self._fix_events({'__type': 'A'}))
+        data = {'a': {}, 'b': [], 'c': [[], {}], '__type': 'A'}
+        self.assertEqual({'a': {}, 'b': [], 'c': [[], {}]}, self._fix_events(data))
+        self.assertEqual([], self._fix_events([]))
+
+    @skipIf(ijson is None, 'requires ijson')
+    def test_fix_json_events_with_top_level_list(self):
+        data = [{'__type': 'A', 'a': 1}, 2, 'x', None, True, False, 1.5, -3, [{'__type': 'B'}]]
+        self.assertEqual([{'a': 1}, 2, 'x', None, True, False, 1.5, -3, [{}]], self._fix_events(data))
+        expected = [{'__type': 'X', 'a': 1}, 2, 'x', None, True, False, 1.5, -3, [{'__type': 'B'}]]
+        self.assertEqual(expected, self._fix_events(data, {'A': 'X'}))
+
+    def test_cli_remove_types(self):
+        data = [{'__type': 'A', 'a': {'__type': 'B', 's': 'a"\u00e9'}}, 2 ** 70]
+        for stream in (False, True) if ijson is not None else (False,):
+            restored = self._run_cli(data, ['remove_types', '-t', '__type'], stream)
+            self.assertEqual([{'a': {'s': 'a"\u00e9'}}, 2 ** 70], restored)
+
+    def test_cli_rename_types(self):
+        data = {'__type': 'A', 'b': [{'__type': 'B'}, {'__type': 'C'}]}
+        expected = {'__type': 'X', 'b': [{'__type': 'Y'}, {'__type': 'C'}]}
+        for stream in (False, True) if ijson is not None else (False,):
+            restored = self._run_cli(data, ['rename_types', '-t', '__type', '-r', 'A:X', 'B:Y'], stream)
+            self.assertEqual(expected, restored)
+
+    def test_cli_with_std_streams(self):
+        class StdBuffer(BytesIO):
+            def close(self):
+                pass
+
+        for stream in (False, True) if ijson is not None else (False,):
+            stdin = TextIOWrapper(StdBuffer(b'{"__type": "A", "a": ["\\u00e9"]}'), encoding='utf-8')
+            stdout = TextIOWrapper(StdBuffer(), encoding='utf-8')
+            args = ['remove_types', '-t', '__type', '-i', '-', '-o', '-'] + (['-s'] if stream else [])
+            with patch('sys.stdin', stdin), patch('sys.stdout', stdout):
+                main(args)
+            self.assertEqual({'a': ['\u00e9']}, json.loads(stdout.buffer.getvalue()))
+
+    @staticmethod
+    def _fix_events(data, rename_map=None):
+        events = ijson.parse(BytesIO(json.dumps(data).encode('utf-8')))
+        return json.loads(''.join(_fix_json_events(events, '__type', rename_map)))
+
+    @staticmethod
+    def _run_cli(data, args, stream):
+        with TemporaryDirectory() as tmp:
+            infile, outfile = os.path.join(tmp, 'in.json'), os.path.join(tmp, 'out.json')
+            with open(infile, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            main(args + ['-i', infile, '-o', outfile] + (['-s'] if stream else []))
+            with open(outfile, encoding='utf-8') as f:
+                return json.load(f)
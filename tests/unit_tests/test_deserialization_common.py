@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Generic, TypeVar, Optional, Tuple
+from typing import Generic, TypeVar, Optional, Tuple, List
 from unittest import TestCase
 
 from tests.test_classes import FooContainer, MyMapping, Child
@@ -254,6 +254,19 @@ class TestSerializationCommon(TestCase):
         for f in deserialized:
             self.assertIsInstance(f, Foo)
 
+    def test_deserialization_of_list_in_parallel(self):
+        class Foo:
+            def __init__(self, i):
+                self.i = i
+
+        @deserializer
+        def deserialize_foo(data) -> Foo:
+            return Foo(data['i'])
+
+        data = [{_TYPE_KEY: 'Foo', 'i': i} for i in range(1000)]
+        deserialized = deserialize(data, type_key=_TYPE_KEY, globals=locals(), parallelism=3)
+        self.assertEqual(list(range(1000)), [f.i for f in deserialized])
+
     def test_deserialization_of_list_with_generic_type_hint(self):
         class Foo:
             pass
@@ -267,6 +280,20 @@ class TestSerializationCommon(TestCase):
         self.assertEqual(2, len(deserialized))
         self.assertTrue(all(isinstance(f, Foo) for f in deserialized))
 
+    def test_deserialization_of_list_with_type_hint_and_inherited_deserializer(self):
+        class Foo:
+            pass
+
+        class Bar(Foo):
+            pass
+
+        @deserializer_of(Foo, include_descendants=True)
+        def foo(_, obj_type=Foo) -> Foo:
+            return obj_type()
+
+        deserialized = deserialize([{}, {}, 1, {}], obj_type=Tuple[Bar, Bar, int, Foo], type_key=None)
+        self.assertEqual([Bar, Bar, int, Foo], [type(f) for f in deserialized])
+
     def test_deserialization_of_iterable_with_type_hint_longer_than_data(self):
         deserialized = deserialize([], Tuple[int, bool, int])
         self.assertIsInstance(deserialized, list)
@@ -285,6 +312,54 @@ class TestSerializationCommon(TestCase):
         self.assertEqual(3, len(deserialized))
         self.assertIsInstance(deserialized[1], Foo)
 
+    def test_deserialization_does_not_modify_data(self):
+        data = {
+            _TYPE_KEY: FooContainer.__name__,
+            'foo': {_TYPE_KEY: FooContainer.__name__, 'foo': [1, 2]},
+        }
+        expected = {
+            _TYPE_KEY: FooContainer.__name__,
+            'foo': {_TYPE_KEY: FooContainer.__name__, 'foo': [1, 2]},
+        }
+        deserialized = deserialize(data, type_key=_TYPE_KEY, globals=globals())
+        self.assertIsInstance(deserialized.foo, FooContainer)
+        self.assertEqual(expected, data)
+
+    def test_deserialization_with_unhashable_custom_deserializer(self):
+        class Foo:
+            pass
+
+        class FooDeserializer:
+            def __eq__(self, other):
+                return self is other
+
+            def __call__(self, data):
+                return Foo()
+
+        deserializer_of(Foo)(FooDeserializer())
+        self.assertIsInstance(deserialize({}, Foo, type_key=None), Foo)
+        self.assertIsInstance(deserialize([{}], List[Foo], type_key=None)[0], Foo)
+
+    def test_deserialization_passes_data_without_type_key_to_custom_deserializer(self):
+        class Foo:
+            pass
+
+        received = []
+
+        @deserializer_of(Foo)
+        def func(d):
+            received.append(d)
+            return Foo()
+
+        data = {_TYPE_KEY: 'Foo', 'a': 1}
+        self.assertIsInstance(deserialize(data, type_key=_TYPE_KEY, globals=locals()), Foo)
+        self.assertEqual([{'a': 1}], received)
+        self.assertEqual({_TYPE_KEY: 'Foo', 'a': 1}, data)
+
+        mapping = {_TYPE_KEY: 'builtins.dict', 'a': 1}
+        self.assertEqual({'a': 1}, deserialize(mapping, type_key=_TYPE_KEY))
+        self.assertEqual({_TYPE_KEY: 'builtins.dict', 'a': 1}, mapping)
+
     def test_deserialization_of_inner_list_of_primitives_with_type_data(self):
         self._check_deserialization_of_inner_iterable_of_primitives(list, True)
 
@@ -294,6 +369,9 @@ class TestSerializationCommon(TestCase):
     def test_deserialization_of_inner_tuple_of_primitives_with_type_data(self):
         self._check_deserialization_of_inner_iterable_of_primitives(tuple, True)
 
+    def test_deserialization_of_inner_frozenset_of_primitives_with_type_data(self):
+        self._check_deserialization_of_inner_iterable_of_primitives(frozenset, True)
+
     def test_deserialization_of_inner_list_of_primitives_without_type_data(self):
         self._check_deserialization_of_inner_iterable_of_primitives(list, False)
 
@@ -7,6 +7,7 @@ from unittest import TestCase
 from tests.test_classes import FooContainer, MyMapping, MyIterable
 from yasoo import serialize, serializer, serializer_of, unregister_serializers
 from yasoo.constants import ENUM_VALUE_KEY, ITERABLE_VALUE_KEY
+from yasoo.serialization import Serializer
 
 _TYPE_KEY = '__type'
 
@@ -108,6 +109,49 @@ class TestSerializationCommon(TestCase):
         self.assertEqual(_dict, serialize(Foo(), type_key=None))
         self.assertEqual(_dict, serialize(Bar(), type_key=None))
 
+    def test_serialization_with_serializer_including_descendants_prefers_closest_base(self):
+        class Foo:
+            pass
+
+        class Bar(Foo):
+            pass
+
+        class Baz(Bar):
+            pass
+
+        @serializer_of(Foo, include_descendants=True)
+        def foo(_: Foo) -> dict:
+            return {'foo': 1}
+
+        @serializer_of(Bar, include_descendants=True)
+        def bar(_: Bar) -> dict:
+            return {'bar': 1}
+
+        self.assertEqual({'foo': 1}, serialize(Foo(), type_key=None))
+        self.assertEqual({'bar': 1}, serialize(Baz(), type_key=None))
+
+    def test_serialization_of_inner_primitives_with_custom_serializer(self):
+        serializer = Serializer()
+
+        @serializer.register(float)
+        def round_float(f: float) -> dict:
+            return {'rounded': round(f, 1)}
+
+        self.assertEqual(1.2345, serializer.serialize(1.2345, type_key=None))
+        self.assertEqual({'x': {'rounded': 1.2}}, serializer.serialize({'x': 1.2345}, type_key=None))
+        self.assertEqual([{'rounded': 1.2}, 1], serializer.serialize([1.2345, 1], type_key=None))
+        with serializer.unregister(float):
+            self.assertEqual({'x': 1.2345}, serializer.serialize({'x': 1.2345}, type_key=None))
+
+        serializer = Serializer()
+
+        @serializer.register(int, include_descendants=True)
+        def serialize_int(i: int) -> dict:
+            return {'value': str(i)}
+
+        expected = {'a': {'value': 'True'}, 'b': {'value': '1'}}
+        self.assertEqual(expected, serializer.serialize({'a': True, 'b': 1}, type_key=None))
+
     def test_serialization_regular_class_raises_error(self):
         class Foo:
             pass
@@ -127,6 +171,14 @@ class TestSerializationCommon(TestCase):
 
         self.assertRaises(TypeError, serialize, Foo())
 
+    def test_serialization_inner_regular_class_error_names_the_inner_class(self):
+        class Foo:
+            pass
+
+        with self.assertRaises(TypeError) as e:
+            serialize(FooContainer([Foo()]))
+        self.assertIn('"Foo"', e.exception.args[0])
+
     def test_serialization_temporary_unregister(self):
         class Foo:
             pass